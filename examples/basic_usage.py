@@ -14,6 +14,9 @@ from wickdata import (
 
 
 async def main():
+    # Capture the current time once so every query uses the same endpoint
+    now = datetime.now(timezone.utc)
+
     # Configure exchanges
     exchange_configs = {
         "binance": create_binance_config(
@@ -53,8 +56,8 @@ async def main():
         print("\n=== Example 2: Querying Stored Data ===")
 
         # Get data for a specific date range
-        start_date = datetime.now(timezone.utc) - timedelta(days=3)
-        end_date = datetime.now(timezone.utc) - timedelta(days=2)
+        start_date = now - timedelta(days=3)
+        end_date = now - timedelta(days=2)
 
         candles = await data_manager.get_historical_data(
             exchange="binance",
@@ -89,8 +92,8 @@ async def main():
             exchange="binance",
             symbol="BTC/USDT",
             timeframe=Timeframe.ONE_HOUR,
-            start_date=datetime.now(timezone.utc) - timedelta(days=7),
-            end_date=datetime.now(timezone.utc),
+            start_date=now - timedelta(days=7),
+            end_date=now,
         )
 
         print(f"Found {len(gaps)} gaps")
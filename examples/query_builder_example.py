@@ -15,6 +15,9 @@ from wickdata import (
 
 
 async def main():
+    # Capture the current time once so every query uses the same endpoint
+    now = datetime.now(timezone.utc)
+
     # Configure exchanges
     exchange_configs = {"binance": create_binance_config()}
 
@@ -52,9 +55,24 @@ async def main():
             .build(),
         ]
 
-        for request in requests:
-            stats = await data_manager.fetch_historical_data(request)
-            print(f"Fetched {stats.total_candles} {request.symbol} {request.timeframe} candles")
+        # The requests are independent, so fetch them concurrently. Each one
+        # already runs up to concurrent_fetchers gap fetches of its own, so
+        # only run two requests at a time to stay within exchange rate limits
+        semaphore = asyncio.Semaphore(2)
+
+        async def fetch(request):
+            async with semaphore:
+                return await data_manager.fetch_historical_data(request)
+
+        results = await asyncio.gather(*(fetch(r) for r in requests), return_exceptions=True)
+
+        for request, result in zip(requests, results):
+            if isinstance(result, Exception):
+                print(f"Failed to fetch {request.symbol} {request.timeframe}: {result}")
+            else:
+                print(
+                    f"Fetched {result.total_candles} {request.symbol} {request.timeframe} candles"
+                )
 
         print("\n=== Using CandleQueryBuilder ===")
 
@@ -67,9 +85,7 @@ async def main():
             query.exchange("binance")
             .symbol("BTC/USDT")
             .timeframe(Timeframe.ONE_HOUR)
-            .date_range(
-                datetime.now(timezone.utc) - timedelta(hours=12), datetime.now(timezone.utc)
-            )
+            .date_range(now - timedelta(hours=12), now)
             .limit(10)
             .execute()
         )
@@ -84,9 +100,7 @@ async def main():
                 .exchange("binance")
                 .symbol("ETH/USDT")
                 .timeframe(Timeframe.FOUR_HOURS)
-                .date_range(
-                    datetime.now(timezone.utc) - timedelta(days=3), datetime.now(timezone.utc)
-                )
+                .date_range(now - timedelta(days=3), now)
                 .limit(page_size)
                 .offset(page * page_size)
                 .execute()
@@ -100,9 +114,7 @@ async def main():
             .exchange("binance")
             .symbol("BTC/USDT")
             .timeframe(Timeframe.ONE_HOUR)
-            .date_range(
-                datetime.now(timezone.utc) - timedelta(hours=24), datetime.now(timezone.utc)
-            )
+            .date_range(now - timedelta(hours=24), now)
             .count()
         )
         print(f"Total candles in last 24h: {count}")
@@ -114,7 +126,7 @@ async def main():
             .exchange("binance")
             .symbol("XRP/USDT")
             .timeframe(Timeframe.ONE_DAY)
-            .date_range(datetime.now(timezone.utc) - timedelta(days=7), datetime.now(timezone.utc))
+            .date_range(now - timedelta(days=7), now)
             .exists()
         )
         print(f"XRP daily data exists: {exists}")
@@ -126,7 +138,7 @@ async def main():
             .exchange("binance")
             .symbol("ETH/USDT")
             .timeframe(Timeframe.FOUR_HOURS)
-            .date_range(datetime.now(timezone.utc) - timedelta(days=2), datetime.now(timezone.utc))
+            .date_range(now - timedelta(days=2), now)
             .stats()
         )
 
@@ -144,7 +156,7 @@ async def main():
             .exchange("binance")
             .symbol("BTC/USDT")
             .timeframe(Timeframe.ONE_HOUR)
-            .date_range(datetime.now(timezone.utc) - timedelta(days=1), datetime.now(timezone.utc))
+            .date_range(now - timedelta(days=1), now)
             .order_by("timestamp", "desc")
             .limit(5)
             .execute()
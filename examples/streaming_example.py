@@ -14,6 +14,9 @@ from wickdata import (
 
 
 async def main():
+    # Capture the current time once so every query uses the same endpoint
+    now = datetime.now(timezone.utc)
+
     # Configure exchanges
     exchange_configs = {"binance": create_binance_config()}
 
@@ -44,11 +47,11 @@ async def main():
 
         stream_options = StreamOptions(
             batch_size=100,
-            delay_ms=500,  # 500ms delay between batches
+            max_outstanding_batches=2,  # Read at most 2 batches ahead of the consumer
         )
 
-        start_date = datetime.now(timezone.utc) - timedelta(hours=2)
-        end_date = datetime.now(timezone.utc)
+        start_date = now - timedelta(hours=2)
+        end_date = now
 
         batch_count = 0
         candle_count = 0
@@ -163,7 +166,8 @@ async def main():
             timeframe=Timeframe.FIVE_MINUTES,
             start_time=int(start_date.timestamp() * 1000),
             end_time=int(end_date.timestamp() * 1000),
-            options=StreamOptions(batch_size=50, max_size=150),
+            # Run batch handlers off the stream loop so slow handlers don't delay it
+            options=StreamOptions(batch_size=50, max_size=150, background_events=True),
         ):
             candle_count += len(batch)
 
@@ -149,3 +149,20 @@ class TestDataRequestBuilder:
 
         assert request.start_date == datetime(2024, 1, 1)
         assert request.end_date == datetime(2024, 1, 31)
+
+    def test_builder_can_be_reused(self):
+        builder = (
+            DataRequestBuilder.create()
+            .with_exchange("binance")
+            .with_symbol("BTC/USDT")
+            .with_timeframe("1h")
+            .with_date_range("2024-01-01", "2024-01-31")
+        )
+
+        first = builder.build()
+        second = builder.with_symbol("ETH/USDT").build()
+
+        assert first is not second
+        assert first.symbol == "BTC/USDT"
+        assert second.symbol == "ETH/USDT"
+        assert second.start_date == first.start_date
@@ -19,6 +19,8 @@ def mock_repository():
     """Create mock candle repository"""
     repository = Mock(spec=CandleRepository)
     repository.get_candles = AsyncMock()
+    repository.get_candle_arrays = AsyncMock()
+    repository.get_candle_stats = AsyncMock()
     repository.count_candles = AsyncMock()
     return repository
 
@@ -224,6 +226,27 @@ class TestCandleQueryBuilder:
         assert result[0].timestamp == sample_candles[-1].timestamp
         assert result[-1].timestamp == sample_candles[0].timestamp
 
+    @pytest.mark.asyncio
+    async def test_execute_as_arrays(self, query_builder, mock_repository, sample_candles):
+        """Test execute returns column arrays in descending order"""
+        np = pytest.importorskip("numpy")
+        mock_repository.get_candle_arrays.return_value = {
+            "timestamp": np.array([c.timestamp for c in sample_candles], dtype=np.int64),
+            "close": np.array([c.close for c in sample_candles], dtype=np.float64),
+        }
+
+        result = await (
+            query_builder.exchange("binance")
+            .symbol("BTC/USDT")
+            .timeframe(Timeframe.ONE_HOUR)
+            .order_by("timestamp", "desc")
+            .execute(as_arrays=True)
+        )
+
+        assert result["timestamp"].tolist() == [c.timestamp for c in reversed(sample_candles)]
+        assert result["close"].tolist() == [c.close for c in reversed(sample_candles)]
+        mock_repository.get_candles.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_ascending_order(self, query_builder, mock_repository, sample_candles):
         """Test execute maintains order for ascending"""
@@ -327,76 +350,52 @@ class TestCandleQueryBuilder:
             await query_builder.stats()
 
     @pytest.mark.asyncio
-    async def test_stats_with_candles(self, query_builder, mock_repository, sample_candles):
-        """Test stats calculation with candles"""
-        mock_repository.get_candles.return_value = sample_candles
+    async def test_stats_uses_repository_aggregate(self, query_builder, mock_repository):
+        """Test stats delegates aggregation to the repository"""
+        expected = {
+            "count": 3,
+            "first_timestamp": 1609459200000,
+            "last_timestamp": 1609459320000,
+            "min_price": 90.0,
+            "max_price": 120.0,
+            "total_volume": 3300.0,
+        }
+        mock_repository.get_candle_stats.return_value = expected
 
         result = await (
             query_builder.exchange("binance")
             .symbol("BTC/USDT")
             .timeframe(Timeframe.ONE_HOUR)
+            .timestamp_range(1609459200000, 1609545600000)
+            .limit(100)
             .stats()
         )
 
-        assert result["count"] == 3
-        assert result["first_timestamp"] == sample_candles[0].timestamp
-        assert result["last_timestamp"] == sample_candles[-1].timestamp
-        assert result["min_price"] == 90.0  # Lowest low
-        assert result["max_price"] == 120.0  # Highest high
-        assert result["total_volume"] == 3300.0  # Sum of volumes
-
-    @pytest.mark.asyncio
-    async def test_stats_with_no_candles(self, query_builder, mock_repository):
-        """Test stats with no candles returns empty stats"""
-        mock_repository.get_candles.return_value = []
-
-        result = await (
-            query_builder.exchange("binance")
-            .symbol("BTC/USDT")
-            .timeframe(Timeframe.ONE_HOUR)
-            .stats()
+        assert result == expected
+        mock_repository.get_candles.assert_not_called()
+        mock_repository.get_candle_stats.assert_called_once_with(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe=Timeframe.ONE_HOUR,
+            start_time=1609459200000,
+            end_time=1609545600000,
+            limit=100,
+            offset=None,
         )
 
-        assert result["count"] == 0
-        assert result["first_timestamp"] is None
-        assert result["last_timestamp"] is None
-        assert result["min_price"] is None
-        assert result["max_price"] is None
-        assert result["total_volume"] == 0
-
     @pytest.mark.asyncio
-    async def test_stats_price_calculation(self, query_builder, mock_repository):
-        """Test stats correctly calculates min/max prices from highs and lows"""
-        candles = [
-            Candle(
-                timestamp=1609459200000,
-                open=100.0,
-                high=150.0,
-                low=50.0,
-                close=105.0,
-                volume=1000.0,
-            ),
-            Candle(
-                timestamp=1609459260000,
-                open=105.0,
-                high=125.0,
-                low=75.0,
-                close=110.0,
-                volume=1100.0,
-            ),
-        ]
-        mock_repository.get_candles.return_value = candles
-
-        result = await (
+    async def test_stats_sets_default_time_range(self, query_builder, mock_repository):
+        """Test stats uses the full time range if not specified"""
+        await (
             query_builder.exchange("binance")
             .symbol("BTC/USDT")
             .timeframe(Timeframe.ONE_HOUR)
             .stats()
         )
 
-        # Min should be lowest low, max should be highest high
-        assert result["min_price"] == 50.0
-        assert result["max_price"] == 150.0
+        call_args = mock_repository.get_candle_stats.call_args
+        assert call_args.kwargs["start_time"] == 0
+        assert call_args.kwargs["end_time"] > 0  # Should be current time
 
     def test_initial_state(self, query_builder):
         """Test initial state of query builder"""
@@ -431,6 +430,7 @@ class TestCandleQueryBuilder:
         """Test that the same builder can be used for multiple queries"""
         mock_repository.get_candles.return_value = sample_candles
         mock_repository.count_candles.return_value = len(sample_candles)
+        mock_repository.get_candle_stats.return_value = {"count": len(sample_candles)}
 
         # Configure builder once
         query_builder.exchange("binance").symbol("BTC/USDT").timeframe(Timeframe.ONE_HOUR)
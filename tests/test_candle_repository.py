@@ -20,8 +20,11 @@ def mock_database():
     database = Mock(spec=Database)
     database.insert_candles = AsyncMock()
     database.get_candles = AsyncMock()
+    database.get_candle_rows = AsyncMock()
+    database.get_candle_timestamps = AsyncMock()
     database.delete_candles = AsyncMock()
     database.count_candles = AsyncMock()
+    database.get_candle_stats = AsyncMock()
     database.get_metadata = AsyncMock()
     database.update_metadata = AsyncMock()
     database.list_datasets = AsyncMock()
@@ -186,6 +189,40 @@ class TestCandleRepository:
             "binance", "BTC/USDT", "1d", 1609459200000, 1609545600000, None, None
         )
 
+    @pytest.mark.asyncio
+    async def test_get_candle_arrays(self, repository, mock_database, sample_candles):
+        """Test getting candles as parallel NumPy arrays"""
+        np = pytest.importorskip("numpy")
+        mock_database.get_candle_rows.return_value = [
+            tuple(candle.to_ccxt()) for candle in sample_candles
+        ]
+
+        result = await repository.get_candle_arrays(
+            "binance", "BTC/USDT", Timeframe.ONE_HOUR, 1609459200000, 1609545600000, limit=100
+        )
+
+        assert result["timestamp"].dtype == np.int64
+        assert result["close"].dtype == np.float64
+        assert result["timestamp"].tolist() == [c.timestamp for c in sample_candles]
+        assert result["volume"].tolist() == [c.volume for c in sample_candles]
+        mock_database.get_candle_rows.assert_called_once_with(
+            "binance", "BTC/USDT", "1h", 1609459200000, 1609545600000, 100, None
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_candle_stats(self, repository, mock_database):
+        """Test getting aggregate candle statistics"""
+        mock_database.get_candle_stats.return_value = {"count": 24}
+
+        result = await repository.get_candle_stats(
+            "binance", "BTC/USDT", Timeframe.ONE_HOUR, 1609459200000, 1609545600000
+        )
+
+        assert result == {"count": 24}
+        mock_database.get_candle_stats.assert_called_once_with(
+            "binance", "BTC/USDT", "1h", 1609459200000, 1609545600000, None, None
+        )
+
     @pytest.mark.asyncio
     async def test_delete_candles_with_time_range(self, repository, mock_database):
         """Test deleting candles with time range"""
@@ -252,7 +289,7 @@ class TestCandleRepository:
     @pytest.mark.asyncio
     async def test_find_data_gaps_no_candles(self, repository, mock_database):
         """Test finding gaps when no candles exist (entire range is a gap)"""
-        mock_database.get_candles.return_value = []
+        mock_database.get_candle_timestamps.return_value = []
 
         start_time = 1609459200000
         end_time = 1609462800000  # 1 hour later (60 minutes)
@@ -288,7 +325,7 @@ class TestCandleRepository:
                 volume=1100.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance", "BTC/USDT", Timeframe.ONE_MINUTE, 1609459200000, 1609459380000
@@ -321,7 +358,7 @@ class TestCandleRepository:
                 volume=1100.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance",
@@ -359,7 +396,7 @@ class TestCandleRepository:
                 volume=1100.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance", "BTC/USDT", Timeframe.ONE_MINUTE, 1609459200000, 1609459380000
@@ -402,7 +439,7 @@ class TestCandleRepository:
                 volume=1200.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance", "BTC/USDT", Timeframe.ONE_MINUTE, 1609459200000, 1609459560000
@@ -452,7 +489,7 @@ class TestCandleRepository:
                 volume=1200.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance", "BTC/USDT", Timeframe.ONE_MINUTE, 1609459200000, 1609459320000
@@ -482,7 +519,7 @@ class TestCandleRepository:
                 volume=1100.0,
             ),
         ]
-        mock_database.get_candles.return_value = candles
+        mock_database.get_candle_timestamps.return_value = [c.timestamp for c in candles]
 
         gaps = await repository.find_data_gaps(
             "binance", "BTC/USDT", Timeframe.ONE_HOUR, 1609459200000, 1609466400000
@@ -207,6 +207,7 @@ class TestDataFetcherService:
 
         # Assert
         assert result == []
+        assert data_fetcher_service.failed_gaps == [sample_gap]
 
     @pytest.mark.asyncio
     async def test_fetch_multiple_gaps_success(
@@ -237,6 +238,7 @@ class TestDataFetcherService:
         # Assert
         assert len(result) == 2
         assert data_fetcher_service.fetch_gap.call_count == 2
+        assert data_fetcher_service.failed_gaps == []
 
     @pytest.mark.asyncio
     async def test_fetch_multiple_gaps_empty_list(self, data_fetcher_service):
@@ -319,6 +321,7 @@ class TestDataFetcherService:
 
         # Assert - should still return candles from successful gap
         assert len(result) == 1
+        assert data_fetcher_service.failed_gaps == [gaps[1]]
 
     @pytest.mark.asyncio
     async def test_fetch_latest_success(
@@ -101,6 +101,72 @@ class TestDataManager:
             mock_fetcher.fetch_multiple_gaps.assert_called_once()
             mock_repository.insert_candles.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_skips_known_empty_gaps(
+        self, data_manager, mock_repository
+    ):
+        """Test gaps that returned no data are not refetched within the TTL"""
+        request = DataRequest(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe=Timeframe.ONE_HOUR,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 2),
+        )
+
+        empty_gap = DataGap(1704067200000, 1704070800000, 2)
+        filled_gap = DataGap(1704078000000, 1704081600000, 2)
+        mock_repository.find_data_gaps.return_value = [empty_gap, filled_gap]
+        mock_repository.insert_candles.return_value = 1
+        mock_repository.count_candles.return_value = 23
+
+        with patch("wickdata.core.data_manager.DataFetcherService") as mock_fetcher_class:
+            mock_fetcher = AsyncMock()
+            mock_fetcher.fetch_multiple_gaps.return_value = [
+                Candle(1704078000000, 50000, 50100, 49900, 50050, 1000)
+            ]
+            mock_fetcher.failed_gaps = []
+            mock_fetcher_class.return_value = mock_fetcher
+
+            await data_manager.fetch_historical_data(request)
+            await data_manager.fetch_historical_data(request)
+
+            first_gaps = mock_fetcher.fetch_multiple_gaps.call_args_list[0].args[2]
+            second_gaps = mock_fetcher.fetch_multiple_gaps.call_args_list[1].args[2]
+            assert first_gaps == [empty_gap, filled_gap]
+            assert second_gaps == [filled_gap]
+
+    @pytest.mark.asyncio
+    async def test_fetch_historical_data_retries_failed_gaps(self, data_manager, mock_repository):
+        """Test gaps whose fetch failed are not cached as empty"""
+        request = DataRequest(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe=Timeframe.ONE_HOUR,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 2),
+        )
+
+        gap = DataGap(1704067200000, 1704070800000, 2)
+        mock_repository.find_data_gaps.return_value = [gap]
+        mock_repository.insert_candles.return_value = 0
+        mock_repository.count_candles.return_value = 22
+
+        with patch("wickdata.core.data_manager.DataFetcherService") as mock_fetcher_class:
+            mock_fetcher = AsyncMock()
+            mock_fetcher.fetch_multiple_gaps.return_value = []
+            mock_fetcher.failed_gaps = [gap]
+            mock_fetcher_class.return_value = mock_fetcher
+
+            await data_manager.fetch_historical_data(request)
+
+            # Exchange recovered
+            mock_fetcher.failed_gaps = []
+            await data_manager.fetch_historical_data(request)
+
+            assert mock_fetcher.fetch_multiple_gaps.call_count == 2
+            assert mock_fetcher.fetch_multiple_gaps.call_args_list[1].args[2] == [gap]
+
     @pytest.mark.asyncio
     async def test_fetch_historical_data_with_progress(self, data_manager, mock_repository):
         """Test progress callback during fetch"""
@@ -118,6 +118,32 @@ class TestDataStreamer:
         # Should have at least 100ms delay between 2 batches
         assert elapsed >= 0.1
 
+    @pytest.mark.asyncio
+    async def test_stream_candles_backpressure(self, data_streamer, mock_repository):
+        """Test reading ahead is bounded by max_outstanding_batches"""
+        test_candles = self.create_test_candles(10)
+        mock_repository.get_candles.side_effect = [[candle] for candle in test_candles] + [[]]
+
+        received = 0
+        max_read_ahead = 0
+
+        async for _ in data_streamer.stream_candles(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            1704067200000,
+            1704103200000,
+            StreamOptions(batch_size=1, max_outstanding_batches=1),
+        ):
+            received += 1
+            # Slow consumer gives the producer every chance to run ahead
+            await asyncio.sleep(0.01)
+            max_read_ahead = max(max_read_ahead, mock_repository.get_candles.call_count - received)
+
+        assert received == 10
+        # One batch queued plus one fetched and waiting to be queued
+        assert max_read_ahead <= 2
+
     @pytest.mark.asyncio
     async def test_stream_events(self, data_streamer, mock_repository):
         """Test event emission during streaming"""
@@ -151,6 +177,97 @@ class TestDataStreamer:
         assert events[1][1] == 5  # 5 candles in batch
         assert events[2][0] == "complete"
 
+    @pytest.mark.asyncio
+    async def test_stream_background_events(self, data_streamer, mock_repository):
+        """Test background batch handlers finish before the complete event"""
+        test_candles = self.create_test_candles(5)
+        mock_repository.get_candles.side_effect = [test_candles[:3], test_candles[3:], []]
+
+        events = []
+
+        async def on_batch(candles):
+            await asyncio.sleep(0.01)
+            events.append(("batch", len(candles)))
+
+        def on_complete(data):
+            events.append(("complete", data["total_candles"]))
+
+        data_streamer.on("batch", on_batch)
+        data_streamer.on("complete", on_complete)
+
+        async for _ in data_streamer.stream_candles(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            1704067200000,
+            1704103200000,
+            StreamOptions(batch_size=3, background_events=True),
+        ):
+            pass
+
+        assert sorted(events[:2]) == [("batch", 2), ("batch", 3)]
+        assert events[2] == ("complete", 5)
+
+    @pytest.mark.asyncio
+    async def test_stream_background_events_bounded(self, data_streamer, mock_repository):
+        """Test background batch handlers in flight are bounded by max_outstanding_batches"""
+        test_candles = self.create_test_candles(6)
+        mock_repository.get_candles.side_effect = [[candle] for candle in test_candles] + [[]]
+
+        running = 0
+        max_running = 0
+
+        async def on_batch(candles):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        data_streamer.on("batch", on_batch)
+
+        async for _ in data_streamer.stream_candles(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            1704067200000,
+            1704103200000,
+            StreamOptions(batch_size=1, max_outstanding_batches=2, background_events=True),
+        ):
+            pass
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_early_exit_cancels_background_events(
+        self, data_streamer, mock_repository
+    ):
+        """Test pending background handlers are cancelled when the stream ends early"""
+        test_candles = self.create_test_candles(10)
+        mock_repository.get_candles.side_effect = [test_candles[:5], test_candles[5:], []]
+
+        release = asyncio.Event()
+
+        async def on_batch(candles):
+            await release.wait()
+
+        data_streamer.on("batch", on_batch)
+
+        stream = data_streamer.stream_candles(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            1704067200000,
+            1704103200000,
+            StreamOptions(batch_size=5, background_events=True),
+        )
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert len(data_streamer._pending) == 0
+        assert data_streamer.is_active() is False
+
     @pytest.mark.asyncio
     async def test_stream_stop(self, data_streamer, mock_repository):
         """Test stopping stream"""
@@ -276,6 +393,66 @@ class TestDataStreamer:
         assert buffer_calls[1] == 4
         assert buffer_calls[2] == 2
 
+    @pytest.mark.asyncio
+    async def test_stream_candles_as_array(self, data_streamer, mock_repository):
+        """Test streaming row-major candle matrices"""
+        pytest.importorskip("numpy")
+        from wickdata.utils import candles_to_arrays
+
+        test_candles = self.create_test_candles(10)
+        mock_repository.get_candle_arrays.side_effect = [
+            candles_to_arrays(test_candles[:5]),
+            candles_to_arrays(test_candles[5:]),
+            candles_to_arrays([]),
+        ]
+
+        batches = []
+        async for batch in data_streamer.stream_candles(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            1704067200000,
+            1704103200000,
+            StreamOptions(batch_size=5, as_array=True),
+        ):
+            batches.append(batch)
+
+        assert len(batches) == 2
+        assert all(batch.shape == (5, 6) for batch in batches)
+        assert all(batch.flags.c_contiguous for batch in batches)
+        assert batches[0][0].tolist() == test_candles[0].to_ccxt()
+        assert batches[1].T[0].tolist() == [c.timestamp for c in test_candles[5:]]
+        mock_repository.get_candles.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_to_buffer_as_array(self, data_streamer, mock_repository):
+        """Test streaming candle matrices to buffer with callback"""
+        pytest.importorskip("numpy")
+        from wickdata.utils import candles_to_arrays
+
+        test_candles = self.create_test_candles(10)
+        mock_repository.get_candle_arrays.side_effect = [
+            candles_to_arrays(test_candles[:6]),
+            candles_to_arrays(test_candles[6:]),
+            candles_to_arrays([]),
+        ]
+
+        buffers = []
+
+        await data_streamer.stream_to_buffer(
+            "binance",
+            "BTC/USDT",
+            Timeframe.ONE_HOUR,
+            datetime(2024, 1, 1),
+            datetime(2024, 1, 2),
+            buffer_size=4,
+            on_buffer=buffers.append,
+            options=StreamOptions(as_array=True),
+        )
+
+        assert [buffer.shape for buffer in buffers] == [(4, 6), (4, 6), (2, 6)]
+        assert buffers[-1][-1, 0] == test_candles[-1].timestamp
+
     @pytest.mark.asyncio
     async def test_stream_error_handling(self, data_streamer, mock_repository):
         """Test error handling during streaming"""
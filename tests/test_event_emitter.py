@@ -2,6 +2,7 @@
 Tests for EventEmitter class
 """
 
+import asyncio
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -136,6 +137,112 @@ class TestEventEmitter:
 
         handler.assert_called_once_with("arg1", key="value")
 
+    @pytest.mark.asyncio
+    async def test_emit_background_runs_handlers(self):
+        """Test background emission runs sync and async handlers"""
+        sync_handler = Mock()
+        async_handler = AsyncMock()
+        self.emitter.on("test_event", sync_handler)
+        self.emitter.on("test_event", async_handler)
+
+        self.emitter.emit_background("test_event", "arg1", key="value")
+        await self.emitter.drain_listeners()
+
+        sync_handler.assert_called_once_with("arg1", key="value")
+        async_handler.assert_called_once_with("arg1", key="value")
+        assert len(self.emitter._pending) == 0
+
+    @pytest.mark.asyncio
+    async def test_emit_background_does_not_wait(self):
+        """Test background emission returns before handlers finish"""
+        release = asyncio.Event()
+        finished = []
+
+        async def slow_handler():
+            await release.wait()
+            finished.append(True)
+
+        self.emitter.on("test_event", slow_handler)
+
+        self.emitter.emit_background("test_event")
+        assert finished == []
+
+        release.set()
+        await self.emitter.drain_listeners()
+        assert finished == [True]
+
+    @pytest.mark.asyncio
+    async def test_drain_listeners_raises_handler_error(self):
+        """Test draining surfaces exceptions from background handlers"""
+        self.emitter.on("test_event", Mock(side_effect=Exception("Test error")))
+
+        self.emitter.emit_background("test_event")
+
+        with pytest.raises(Exception, match="Test error"):
+            await self.emitter.drain_listeners()
+
+    @pytest.mark.asyncio
+    async def test_emit_background_once_handler(self):
+        """Test once handlers are unregistered before background dispatch"""
+        handler = Mock()
+        self.emitter.once("test_event", handler)
+
+        self.emitter.emit_background("test_event", 1)
+        assert self.emitter.listener_count("test_event") == 0
+
+        self.emitter.emit_background("test_event", 2)
+        await self.emitter.drain_listeners()
+
+        handler.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_drain_listeners_limit(self):
+        """Test draining down to a limit waits for the oldest emissions"""
+        releases = [asyncio.Event() for _ in range(3)]
+        finished = []
+
+        async def handler(index):
+            await releases[index].wait()
+            finished.append(index)
+
+        self.emitter.on("test_event", handler)
+        for index in range(3):
+            self.emitter.emit_background("test_event", index)
+
+        releases[0].set()
+        await self.emitter.drain_listeners(2)
+
+        assert finished == [0]
+        assert len(self.emitter._pending) == 2
+
+        releases[1].set()
+        releases[2].set()
+        await self.emitter.drain_listeners()
+        assert sorted(finished) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_cancel_listeners(self):
+        """Test cancelling pending emissions returns handler errors"""
+        release = asyncio.Event()
+
+        async def slow_handler():
+            await release.wait()
+
+        async def failing_handler():
+            raise ValueError("Test error")
+
+        self.emitter.on("slow_event", slow_handler)
+        self.emitter.on("failing_event", failing_handler)
+
+        self.emitter.emit_background("slow_event")
+        self.emitter.emit_background("failing_event")
+        await asyncio.sleep(0.01)
+
+        errors = self.emitter.cancel_listeners()
+
+        assert [str(error) for error in errors] == ["Test error"]
+        assert len(self.emitter._pending) == 0
+
     @pytest.mark.asyncio
     async def test_emit_multiple_handlers(self):
         """Test emitting event with multiple handlers"""
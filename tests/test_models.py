@@ -180,6 +180,7 @@ class TestStreamOptions:
         assert options.delay_ms == 0
         assert options.realtime is False
         assert options.max_size is None
+        assert options.max_outstanding_batches == 2
 
     def test_stream_options_validation(self):
         with pytest.raises(ValueError):
@@ -190,3 +191,6 @@ class TestStreamOptions:
 
         with pytest.raises(ValueError):
             StreamOptions(max_size=0)
+
+        with pytest.raises(ValueError):
+            StreamOptions(max_outstanding_batches=0)
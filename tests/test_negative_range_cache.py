@@ -0,0 +1,73 @@
+"""
+Unit tests for NegativeRangeCache
+"""
+
+import pytest
+
+from wickdata.services.negative_range_cache import NegativeRangeCache
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create fake clock"""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Create NegativeRangeCache instance"""
+    return NegativeRangeCache(ttl=300.0, clock=clock)
+
+
+class TestNegativeRangeCache:
+
+    def test_contains_cached_range(self, cache):
+        """Test a cached range and its sub-ranges are reported empty"""
+        cache.add("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        assert cache.contains("binance", "BTC/USDT", "1h", 1000, 5000)
+        assert cache.contains("binance", "BTC/USDT", "1h", 2000, 3000)
+
+    def test_does_not_contain_overlapping_range(self, cache):
+        """Test a range extending past the cached range is not reported empty"""
+        cache.add("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        assert not cache.contains("binance", "BTC/USDT", "1h", 500, 3000)
+        assert not cache.contains("binance", "BTC/USDT", "1h", 3000, 6000)
+
+    def test_keys_are_separate(self, cache):
+        """Test ranges are scoped by exchange, symbol and timeframe"""
+        cache.add("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        assert not cache.contains("kraken", "BTC/USDT", "1h", 1000, 5000)
+        assert not cache.contains("binance", "ETH/USDT", "1h", 1000, 5000)
+        assert not cache.contains("binance", "BTC/USDT", "1d", 1000, 5000)
+
+    def test_entries_expire(self, cache, clock):
+        """Test cached ranges expire after the TTL"""
+        cache.add("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        clock.now += 299.0
+        assert cache.contains("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        clock.now += 2.0
+        assert not cache.contains("binance", "BTC/USDT", "1h", 1000, 5000)
+        assert cache._ranges == {}
+
+    def test_clear(self, cache):
+        """Test clearing the cache"""
+        cache.add("binance", "BTC/USDT", "1h", 1000, 5000)
+
+        cache.clear()
+
+        assert not cache.contains("binance", "BTC/USDT", "1h", 1000, 5000)
@@ -73,6 +73,47 @@ class TestSQLiteDatabase:
         # After disconnect, engine should be disposed but references may still exist
         # The important thing is that the connection is closed
 
+    @pytest.mark.asyncio
+    async def test_connect_uses_pool_config(self, temp_db_path):
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        from wickdata.models.config import PoolConfig
+
+        db = SQLiteDatabase(
+            f"sqlite:///{temp_db_path}", pool_config=PoolConfig(max_connections=4, timeout=5.0)
+        )
+        await db.connect()
+
+        pool = db.engine.pool
+        assert isinstance(pool, AsyncAdaptedQueuePool)
+        assert pool.size() == 4
+        assert pool._max_overflow == 0
+        assert pool._timeout == 5.0
+
+        await db.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connections_use_wal_mode(self, db):
+        from sqlalchemy import text
+
+        async with db.engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+
+    @pytest.mark.asyncio
+    async def test_memory_database_skips_queue_pool(self):
+        from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+        db = SQLiteDatabase("sqlite:///:memory:")
+        await db.connect()
+
+        assert not isinstance(db.engine.pool, AsyncAdaptedQueuePool)
+
+        await db.disconnect()
+
     @pytest.mark.asyncio
     async def test_insert_and_get_candles(self, db):
         timestamp = datetime(2024, 1, 1, 12, 0)
@@ -105,6 +146,60 @@ class TestSQLiteDatabase:
         assert candles[0].open == 100.0
         assert candles[0].close == 103.0
 
+    @pytest.mark.asyncio
+    async def test_get_candle_rows(self, db):
+        candle = Candle(
+            timestamp=self.datetime_to_ms(datetime(2024, 1, 1, 12, 0)),
+            open=100.0,
+            high=105.0,
+            low=99.0,
+            close=103.0,
+            volume=1000.0,
+        )
+        await db.insert_candles(
+            exchange="binance", symbol="BTC/USDT", timeframe="1m", candles=[candle]
+        )
+
+        rows = await db.get_candle_rows(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe="1m",
+            start_time=self.datetime_to_ms(datetime(2024, 1, 1)),
+            end_time=self.datetime_to_ms(datetime(2024, 1, 2)),
+        )
+
+        assert rows == [tuple(candle.to_ccxt())]
+
+    @pytest.mark.asyncio
+    async def test_get_candle_timestamps(self, db):
+        candles = [
+            Candle(
+                timestamp=self.datetime_to_ms(datetime(2024, 1, 1, 12, i)),
+                open=100.0,
+                high=105.0,
+                low=99.0,
+                close=103.0,
+                volume=1000.0,
+            )
+            for i in (2, 0, 1)
+        ]
+        await db.insert_candles(
+            exchange="binance", symbol="BTC/USDT", timeframe="1m", candles=candles
+        )
+
+        timestamps = await db.get_candle_timestamps(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe="1m",
+            start_time=self.datetime_to_ms(datetime(2024, 1, 1, 12, 1)),
+            end_time=self.datetime_to_ms(datetime(2024, 1, 2)),
+        )
+
+        assert timestamps == [
+            self.datetime_to_ms(datetime(2024, 1, 1, 12, 1)),
+            self.datetime_to_ms(datetime(2024, 1, 1, 12, 2)),
+        ]
+
     @pytest.mark.asyncio
     async def test_insert_candles_batch(self, db):
         candles = []
@@ -177,6 +272,35 @@ class TestSQLiteDatabase:
         assert len(candles) == 1
         assert candles[0].open == 100.0  # Original value
 
+    @pytest.mark.asyncio
+    async def test_insert_counts_only_new_candles(self, db):
+        candles = [
+            Candle(
+                timestamp=self.datetime_to_ms(datetime(2024, 1, 1, 12, i)),
+                open=100.0,
+                high=105.0,
+                low=99.0,
+                close=103.0,
+                volume=1000.0,
+            )
+            for i in range(3)
+        ]
+
+        await db.insert_candles(
+            exchange="binance", symbol="BTC/USDT", timeframe="1m", candles=candles[:2]
+        )
+
+        # Overlapping batch, including a duplicate within the batch itself
+        count = await db.insert_candles(
+            exchange="binance",
+            symbol="BTC/USDT",
+            timeframe="1m",
+            candles=candles + [candles[2]],
+        )
+
+        assert count == 1
+        assert await db.count_candles(exchange="binance", symbol="BTC/USDT", timeframe="1m") == 3
+
     @pytest.mark.asyncio
     async def test_get_candles_with_filters(self, db):
         candles = []
@@ -304,6 +428,71 @@ class TestSQLiteDatabase:
 
         assert count == 5
 
+    @pytest.mark.asyncio
+    async def test_get_candle_stats(self, db):
+        candles = []
+        for i in range(5):
+            timestamp = datetime(2024, 1, 1, 12, i)
+            candles.append(
+                Candle(
+                    timestamp=self.datetime_to_ms(timestamp),
+                    open=100.0 + i,
+                    high=105.0 + i,
+                    low=99.0 + i,
+                    close=103.0 + i,
+                    volume=1000.0 + i,
+                )
+            )
+
+        await db.insert_candles(
+            exchange="binance", symbol="BTC/USDT", timeframe="1m", candles=candles
+        )
+
+        start_time = self.datetime_to_ms(datetime(2024, 1, 1))
+        end_time = self.datetime_to_ms(datetime(2024, 1, 2))
+
+        stats = await db.get_candle_stats("binance", "BTC/USDT", "1m", start_time, end_time)
+
+        assert stats == {
+            "count": 5,
+            "first_timestamp": candles[0].timestamp,
+            "last_timestamp": candles[-1].timestamp,
+            "min_price": 99.0,
+            "max_price": 109.0,
+            "total_volume": 5010.0,
+        }
+
+        # Paged stats aggregate only the selected candles
+        paged = await db.get_candle_stats(
+            "binance", "BTC/USDT", "1m", start_time, end_time, limit=2, offset=1
+        )
+
+        assert paged["count"] == 2
+        assert paged["first_timestamp"] == candles[1].timestamp
+        assert paged["last_timestamp"] == candles[2].timestamp
+        assert paged["min_price"] == 100.0
+        assert paged["max_price"] == 107.0
+        assert paged["total_volume"] == 2003.0
+
+    @pytest.mark.asyncio
+    async def test_get_candle_stats_empty(self, db):
+        stats = await db.get_candle_stats(
+            "binance",
+            "BTC/USDT",
+            "1m",
+            self.datetime_to_ms(datetime(2024, 1, 1)),
+            self.datetime_to_ms(datetime(2024, 1, 2)),
+        )
+
+        assert stats == {
+            "count": 0,
+            "first_timestamp": None,
+            "last_timestamp": None,
+            "min_price": None,
+            "max_price": None,
+            "total_volume": 0,
+        }
+
     @pytest.mark.asyncio
     async def test_get_and_update_metadata(self, db):
         # Insert some candles first
@@ -137,3 +137,30 @@ class TestValidation:
         assert is_valid_timeframe("1d")
         assert not is_valid_timeframe("2m")
         assert not is_valid_timeframe("invalid")
+
+
+class TestCandleArrays:
+    def test_rows_to_arrays(self):
+        np = pytest.importorskip("numpy")
+        from wickdata.utils import rows_to_arrays
+
+        rows = [
+            (1609459200000, 100.0, 110.0, 90.0, 105.0, 1000.0),
+            (1609459260000, 105.0, 115.0, 95.0, 110.0, 1100.0),
+        ]
+
+        arrays = rows_to_arrays(rows)
+
+        assert list(arrays) == ["timestamp", "open", "high", "low", "close", "volume"]
+        assert arrays["timestamp"].dtype == np.int64
+        assert arrays["high"].dtype == np.float64
+        assert arrays["timestamp"].tolist() == [1609459200000, 1609459260000]
+        assert arrays["low"].tolist() == [90.0, 95.0]
+
+    def test_rows_to_arrays_empty(self):
+        pytest.importorskip("numpy")
+        from wickdata.utils import rows_to_arrays
+
+        arrays = rows_to_arrays([])
+
+        assert all(len(column) == 0 for column in arrays.values())
@@ -3,13 +3,16 @@ Builder pattern for querying candle data
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, overload
 
 from wickdata.core.errors import ValidationError
 from wickdata.database.candle_repository import CandleRepository
 from wickdata.models.candle import Candle
 from wickdata.models.timeframe import Timeframe
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class CandleQueryBuilder:
     """Builder for querying candle data"""
@@ -157,12 +160,29 @@ class CandleQueryBuilder:
         if not self._timeframe:
             raise ValidationError("Timeframe is required for query", field="timeframe")
 
-    async def execute(self) -> List[Candle]:
+    @overload
+    async def execute(self, as_arrays: Literal[False] = ...) -> List[Candle]: ...
+
+    @overload
+    async def execute(self, as_arrays: Literal[True]) -> Dict[str, "np.ndarray"]: ...
+
+    @overload
+    async def execute(
+        self, as_arrays: bool = ...
+    ) -> Union[List[Candle], Dict[str, "np.ndarray"]]: ...
+
+    async def execute(
+        self, as_arrays: bool = False
+    ) -> Union[List[Candle], Dict[str, "np.ndarray"]]:
         """
         Execute the query
 
+        Args:
+            as_arrays: Return parallel NumPy arrays instead of Candle objects
+
         Returns:
-            List of candles matching the query
+            List of candles matching the query, or dictionary of column arrays
+            if as_arrays is set
         """
         self._validate_query()
 
@@ -177,6 +197,23 @@ class CandleQueryBuilder:
         if self._end_time is None:
             self._end_time = int(datetime.utcnow().timestamp() * 1000)
 
+        if as_arrays:
+            arrays = await self.repository.get_candle_arrays(
+                exchange=self._exchange,
+                symbol=self._symbol,
+                timeframe=self._timeframe,
+                start_time=self._start_time,
+                end_time=self._end_time,
+                limit=self._limit,
+                offset=self._offset,
+            )
+
+            # Reversed views keep the columns zero-copy
+            if self._order_direction == "desc":
+                arrays = {name: column[::-1] for name, column in arrays.items()}
+
+            return arrays
+
         candles = await self.repository.get_candles(
             exchange=self._exchange,
             symbol=self._symbol,
@@ -225,39 +262,32 @@ class CandleQueryBuilder:
         count = await self.count()
         return count > 0
 
-    async def stats(self) -> dict:
+    async def stats(self) -> Dict[str, Any]:
         """
         Get statistics for matching candles
 
+        The aggregation runs in the database, so no candles are loaded.
+
         Returns:
             Statistics dictionary
         """
         self._validate_query()
 
-        candles = await self.execute()
-
-        if not candles:
-            return {
-                "count": 0,
-                "first_timestamp": None,
-                "last_timestamp": None,
-                "min_price": None,
-                "max_price": None,
-                "total_volume": 0,
-            }
-
-        prices = []
-        volumes = []
-
-        for candle in candles:
-            prices.extend([candle.low, candle.high])
-            volumes.append(candle.volume)
-
-        return {
-            "count": len(candles),
-            "first_timestamp": candles[0].timestamp,
-            "last_timestamp": candles[-1].timestamp,
-            "min_price": min(prices),
-            "max_price": max(prices),
-            "total_volume": sum(volumes),
-        }
+        # After validation, we know these are not None
+        assert self._exchange is not None
+        assert self._symbol is not None
+        assert self._timeframe is not None
+
+        return await self.repository.get_candle_stats(
+            exchange=self._exchange,
+            symbol=self._symbol,
+            timeframe=self._timeframe,
+            start_time=self._start_time if self._start_time is not None else 0,
+            end_time=(
+                self._end_time
+                if self._end_time is not None
+                else int(datetime.utcnow().timestamp() * 1000)
+            ),
+            limit=self._limit,
+            offset=self._offset,
+        )
@@ -3,7 +3,7 @@ Builder pattern for creating data requests
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Union
+from typing import Any, Dict, Union
 
 from wickdata.core.errors import ValidationError
 from wickdata.models.data_request import DataRequest
@@ -13,16 +13,21 @@ from wickdata.models.timeframe import Timeframe
 class DataRequestBuilder:
     """Builder for creating DataRequest objects"""
 
+    __slots__ = ("_state",)
+
     def __init__(self) -> None:
         """Initialize the builder"""
-        self._exchange: Optional[str] = None
-        self._symbol: Optional[str] = None
-        self._timeframe: Optional[Timeframe] = None
-        self._start_date: Optional[datetime] = None
-        self._end_date: Optional[datetime] = None
-        self._batch_size: int = 500
-        self._concurrent_fetchers: int = 3
-        self._rate_limit_delay: Optional[float] = None
+        # DataRequest keyword arguments, updated in place by the with_* methods
+        self._state: Dict[str, Any] = {
+            "exchange": None,
+            "symbol": None,
+            "timeframe": None,
+            "start_date": None,
+            "end_date": None,
+            "batch_size": 500,
+            "concurrent_fetchers": 3,
+            "rate_limit_delay": None,
+        }
 
     @classmethod
     def create(cls) -> "DataRequestBuilder":
@@ -39,7 +44,7 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._exchange = exchange
+        self._state["exchange"] = exchange
         return self
 
     def with_symbol(self, symbol: str) -> "DataRequestBuilder":
@@ -52,7 +57,7 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._symbol = symbol
+        self._state["symbol"] = symbol
         return self
 
     def with_timeframe(self, timeframe: Union[str, Timeframe]) -> "DataRequestBuilder":
@@ -66,9 +71,9 @@ class DataRequestBuilder:
             Builder instance for chaining
         """
         if isinstance(timeframe, str):
-            self._timeframe = Timeframe.from_string(timeframe)
+            self._state["timeframe"] = Timeframe.from_string(timeframe)
         else:
-            self._timeframe = timeframe
+            self._state["timeframe"] = timeframe
         return self
 
     def with_date_range(
@@ -87,14 +92,14 @@ class DataRequestBuilder:
             Builder instance for chaining
         """
         if isinstance(start, str):
-            self._start_date = datetime.fromisoformat(start)
+            self._state["start_date"] = datetime.fromisoformat(start)
         else:
-            self._start_date = start
+            self._state["start_date"] = start
 
         if isinstance(end, str):
-            self._end_date = datetime.fromisoformat(end)
+            self._state["end_date"] = datetime.fromisoformat(end)
         else:
-            self._end_date = end
+            self._state["end_date"] = end
 
         return self
 
@@ -108,8 +113,9 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._end_date = datetime.now(timezone.utc).replace(tzinfo=None)
-        self._start_date = self._end_date - timedelta(days=days)
+        end_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._state["end_date"] = end_date
+        self._state["start_date"] = end_date - timedelta(days=days)
         return self
 
     def with_last_hours(self, hours: int) -> "DataRequestBuilder":
@@ -122,8 +128,9 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._end_date = datetime.now(timezone.utc).replace(tzinfo=None)
-        self._start_date = self._end_date - timedelta(hours=hours)
+        end_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._state["end_date"] = end_date
+        self._state["start_date"] = end_date - timedelta(hours=hours)
         return self
 
     def with_last_weeks(self, weeks: int) -> "DataRequestBuilder":
@@ -136,8 +143,9 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._end_date = datetime.now(timezone.utc).replace(tzinfo=None)
-        self._start_date = self._end_date - timedelta(weeks=weeks)
+        end_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._state["end_date"] = end_date
+        self._state["start_date"] = end_date - timedelta(weeks=weeks)
         return self
 
     def with_month_to_date(self) -> "DataRequestBuilder":
@@ -147,8 +155,11 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._end_date = datetime.now(timezone.utc).replace(tzinfo=None)
-        self._start_date = self._end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        end_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._state["end_date"] = end_date
+        self._state["start_date"] = end_date.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
         return self
 
     def with_year_to_date(self) -> "DataRequestBuilder":
@@ -158,8 +169,9 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._end_date = datetime.now(timezone.utc).replace(tzinfo=None)
-        self._start_date = self._end_date.replace(
+        end_date = datetime.now(timezone.utc).replace(tzinfo=None)
+        self._state["end_date"] = end_date
+        self._state["start_date"] = end_date.replace(
             month=1, day=1, hour=0, minute=0, second=0, microsecond=0
         )
         return self
@@ -174,7 +186,7 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._batch_size = batch_size
+        self._state["batch_size"] = batch_size
         return self
 
     def with_concurrent_fetchers(self, concurrent_fetchers: int) -> "DataRequestBuilder":
@@ -187,7 +199,7 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._concurrent_fetchers = concurrent_fetchers
+        self._state["concurrent_fetchers"] = concurrent_fetchers
         return self
 
     def with_rate_limit_delay(self, delay: float) -> "DataRequestBuilder":
@@ -200,7 +212,7 @@ class DataRequestBuilder:
         Returns:
             Builder instance for chaining
         """
-        self._rate_limit_delay = delay
+        self._state["rate_limit_delay"] = delay
         return self
 
     def build(self) -> DataRequest:
@@ -213,28 +225,21 @@ class DataRequestBuilder:
         Raises:
             ValidationError: If required fields are missing
         """
-        if not self._exchange:
+        state = self._state
+
+        if not state["exchange"]:
             raise ValidationError("Exchange is required", field="exchange")
 
-        if not self._symbol:
+        if not state["symbol"]:
             raise ValidationError("Symbol is required", field="symbol")
 
-        if not self._timeframe:
+        if not state["timeframe"]:
             raise ValidationError("Timeframe is required", field="timeframe")
 
-        if not self._start_date:
+        if not state["start_date"]:
             raise ValidationError("Start date is required", field="start_date")
 
-        if not self._end_date:
+        if not state["end_date"]:
             raise ValidationError("End date is required", field="end_date")
 
-        return DataRequest(
-            exchange=self._exchange,
-            symbol=self._symbol,
-            timeframe=self._timeframe,
-            start_date=self._start_date,
-            end_date=self._end_date,
-            batch_size=self._batch_size,
-            concurrent_fetchers=self._concurrent_fetchers,
-            rate_limit_delay=self._rate_limit_delay,
-        )
+        return DataRequest(**state)
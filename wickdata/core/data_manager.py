@@ -2,8 +2,10 @@
 Data manager component for fetching and managing historical data
 """
 
+import time
+from bisect import bisect_left
 from datetime import datetime
-from typing import Callable, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Optional, Union, overload
 
 from wickdata.database.candle_repository import CandleRepository
 from wickdata.exchanges.exchange_manager import ExchangeManager
@@ -18,8 +20,12 @@ from wickdata.models.timeframe import Timeframe
 from wickdata.services.data_fetcher_service import DataFetcherService
 from wickdata.services.data_validation_service import DataValidationService
 from wickdata.services.gap_analysis_service import GapAnalysisService
+from wickdata.services.negative_range_cache import NegativeRangeCache
 from wickdata.utils.logger import Logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 ProgressCallback = Callable[[ProgressInfo], None]
 
 
@@ -31,6 +37,7 @@ class DataManager:
         repository: CandleRepository,
         exchange_manager: ExchangeManager,
         logger: Optional[Logger] = None,
+        empty_range_ttl: float = 300.0,
     ) -> None:
         """
         Initialize data manager
@@ -39,12 +46,14 @@ class DataManager:
             repository: Candle repository
             exchange_manager: Exchange manager
             logger: Logger instance
+            empty_range_ttl: Seconds to remember ranges the exchange had no data for
         """
         self.repository = repository
         self.exchange_manager = exchange_manager
         self.logger = logger or Logger("DataManager")
         self.gap_service = GapAnalysisService(logger)
         self.validation_service = DataValidationService(logger)
+        self.empty_range_cache = NegativeRangeCache(ttl=empty_range_ttl)
 
     async def fetch_historical_data(
         self,
@@ -113,6 +122,9 @@ class DataManager:
             request.timeframe,
         )
 
+        # Skip gaps the exchange recently returned no data for
+        gaps = self._filter_known_empty_gaps(request, gaps)
+
         # Fetch data for gaps
         if gaps:
             candles = await fetcher.fetch_multiple_gaps(
@@ -124,6 +136,10 @@ class DataManager:
                 progress_callback,
             )
 
+            # A failed fetch says nothing about whether the exchange has data
+            fetched_gaps = [gap for gap in gaps if gap not in fetcher.failed_gaps]
+            self._cache_empty_gaps(request, fetched_gaps, candles)
+
             # Store fetched candles
             if progress_callback:
                 progress_callback(
@@ -187,6 +203,72 @@ class DataManager:
 
         return stats
 
+    def _filter_known_empty_gaps(self, request: DataRequest, gaps: List[DataGap]) -> List[DataGap]:
+        """
+        Remove gaps that are covered by recently seen empty ranges
+
+        Args:
+            request: Data request
+            gaps: Gaps to fetch
+
+        Returns:
+            Gaps that still need fetching
+        """
+        remaining = [
+            gap
+            for gap in gaps
+            if not self.empty_range_cache.contains(
+                request.exchange,
+                request.symbol,
+                str(request.timeframe),
+                gap.start_time,
+                gap.end_time,
+            )
+        ]
+
+        if len(remaining) < len(gaps):
+            self.logger.debug(
+                f"Skipping {len(gaps) - len(remaining)} gaps with no data on exchange",
+                exchange=request.exchange,
+                symbol=request.symbol,
+                timeframe=str(request.timeframe),
+            )
+
+        return remaining
+
+    def _cache_empty_gaps(
+        self, request: DataRequest, gaps: List[DataGap], candles: List[Candle]
+    ) -> None:
+        """
+        Remember gaps for which the exchange returned no candles
+
+        Gaps reaching the current candle are not cached since new data may
+        appear there at any moment.
+
+        Args:
+            request: Data request
+            gaps: Gaps that were fetched
+            candles: Fetched candles, sorted by timestamp
+        """
+        timestamps = [candle.timestamp for candle in candles]
+        open_candle_start = int(time.time() * 1000) - request.timeframe.to_milliseconds()
+
+        for gap in gaps:
+            if gap.end_time >= open_candle_start:
+                continue
+
+            index = bisect_left(timestamps, gap.start_time)
+            if index < len(timestamps) and timestamps[index] <= gap.end_time:
+                continue
+
+            self.empty_range_cache.add(
+                request.exchange,
+                request.symbol,
+                str(request.timeframe),
+                gap.start_time,
+                gap.end_time,
+            )
+
     async def update_latest_data(
         self,
         exchange: str,
@@ -230,6 +312,46 @@ class DataManager:
 
         return inserted
 
+    @overload
+    async def get_historical_data(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = ...,
+        offset: Optional[int] = ...,
+        as_arrays: Literal[False] = ...,
+    ) -> List[Candle]: ...
+
+    @overload
+    async def get_historical_data(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = ...,
+        offset: Optional[int] = ...,
+        *,
+        as_arrays: Literal[True],
+    ) -> Dict[str, "np.ndarray"]: ...
+
+    @overload
+    async def get_historical_data(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = ...,
+        offset: Optional[int] = ...,
+        as_arrays: bool = ...,
+    ) -> Union[List[Candle], Dict[str, "np.ndarray"]]: ...
+
     async def get_historical_data(
         self,
         exchange: str,
@@ -239,7 +361,8 @@ class DataManager:
         end_date: datetime,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
-    ) -> List[Candle]:
+        as_arrays: bool = False,
+    ) -> Union[List[Candle], Dict[str, "np.ndarray"]]:
         """
         Get historical data from the database
 
@@ -251,13 +374,19 @@ class DataManager:
             end_date: End date
             limit: Maximum number of candles
             offset: Number of candles to skip
+            as_arrays: Return parallel NumPy arrays instead of Candle objects
 
         Returns:
-            List of candles
+            List of candles, or dictionary of column arrays if as_arrays is set
         """
         start_time = int(start_date.timestamp() * 1000)
         end_time = int(end_date.timestamp() * 1000)
 
+        if as_arrays:
+            return await self.repository.get_candle_arrays(
+                exchange, symbol, timeframe, start_time, end_time, limit, offset
+            )
+
         return await self.repository.get_candles(
             exchange, symbol, timeframe, start_time, end_time, limit, offset
         )
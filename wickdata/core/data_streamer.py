@@ -4,15 +4,26 @@ Data streamer component for streaming historical data
 
 import asyncio
 from datetime import datetime
-from typing import AsyncGenerator, Callable, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, List, Optional, Union, cast
 
 from wickdata.core.event_emitter import EventEmitter
 from wickdata.database.candle_repository import CandleRepository
 from wickdata.models.candle import Candle
 from wickdata.models.stream_options import StreamOptions
 from wickdata.models.timeframe import Timeframe
+from wickdata.utils.candle_arrays import arrays_to_matrix, concat_matrices
 from wickdata.utils.logger import Logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# A batch is either a list of candles or, with StreamOptions.as_array, a
+# row-major (n, 6) float64 matrix of timestamp, open, high, low, close, volume
+CandleBatch = Union[List[Candle], "np.ndarray"]
+
+# Queue marker signalling that the producer has no more batches
+_END_OF_STREAM = object()
+
 
 class DataStreamer(EventEmitter):
     """Streamer for historical candle data"""
@@ -43,10 +54,14 @@ class DataStreamer(EventEmitter):
         start_time: int,
         end_time: int,
         options: Optional[StreamOptions] = None,
-    ) -> AsyncGenerator[List[Candle], None]:
+    ) -> AsyncGenerator[CandleBatch, None]:
         """
         Stream candles as an async generator
 
+        Batches are read ahead by a background task into a bounded queue of
+        options.max_outstanding_batches, so a fast consumer rarely waits on the
+        database and a slow consumer pauses reading instead of buffering.
+
         Args:
             exchange: Exchange name
             symbol: Trading pair symbol
@@ -56,12 +71,16 @@ class DataStreamer(EventEmitter):
             options: Stream options
 
         Yields:
-            Batches of candles
+            Batches of candles, or C-contiguous candle matrices if
+            options.as_array is set
         """
         options = options or StreamOptions()
         self._is_active = True
         self._stop_requested = False
 
+        queue: asyncio.Queue = asyncio.Queue(maxsize=options.max_outstanding_batches)
+        producer: Optional[asyncio.Task] = None
+
         try:
             # Emit start event
             await self.emit(
@@ -75,40 +94,42 @@ class DataStreamer(EventEmitter):
                 },
             )
 
-            offset = 0
+            producer = asyncio.create_task(
+                self._produce_batches(
+                    queue, exchange, symbol, timeframe, start_time, end_time, options
+                )
+            )
+
             total_streamed = 0
 
             while not self._stop_requested:
-                # Fetch batch
-                candles = await self.repository.get_candles(
-                    exchange,
-                    symbol,
-                    timeframe,
-                    start_time,
-                    end_time,
-                    limit=options.batch_size,
-                    offset=offset,
-                )
+                candles = await queue.get()
 
-                if not candles:
+                if candles is _END_OF_STREAM:
                     break
+                if isinstance(candles, Exception):
+                    raise candles
 
-                # Apply max_size limit
-                if options.max_size and total_streamed + len(candles) > options.max_size:
-                    candles = candles[: options.max_size - total_streamed]
+                # A stop may have been requested while this batch was queued
+                if self._stop_requested:
+                    break
+
+                if options.as_array:
+                    assert candles.flags.c_contiguous
 
                 # Emit batch event
-                await self.emit("batch", candles)
+                if options.background_events:
+                    # Bound handlers still running so a slow one can't hold
+                    # on to an unbounded number of batches
+                    await self.drain_listeners(options.max_outstanding_batches - 1)
+                    self.emit_background("batch", candles)
+                else:
+                    await self.emit("batch", candles)
 
                 # Yield batch
                 yield candles
 
                 total_streamed += len(candles)
-                offset += len(candles)
-
-                # Check if reached max_size
-                if options.max_size and total_streamed >= options.max_size:
-                    break
 
                 # Apply delay
                 if options.delay_ms > 0:
@@ -117,12 +138,15 @@ class DataStreamer(EventEmitter):
                 # Realtime simulation
                 if options.realtime and len(candles) > 0:
                     # Calculate time between first and last candle
-                    time_span = candles[-1].timestamp - candles[0].timestamp
+                    time_span = self._batch_time_span(candles)
                     if time_span > 0:
                         # Sleep for proportional time
                         sleep_time = time_span / 1000  # Convert to seconds
                         await asyncio.sleep(sleep_time)
 
+            # Let background batch handlers finish before reporting completion
+            await self.drain_listeners()
+
             # Emit complete event
             await self.emit(
                 "complete",
@@ -145,8 +169,89 @@ class DataStreamer(EventEmitter):
             raise
 
         finally:
+            if producer is not None and not producer.done():
+                producer.cancel()
+            # Background handlers are left pending if the stream ended early
+            for error in self.cancel_listeners():
+                self.logger.error(f"Batch handler error: {error}")
             self._is_active = False
 
+    async def _produce_batches(
+        self,
+        queue: asyncio.Queue,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_time: int,
+        end_time: int,
+        options: StreamOptions,
+    ) -> None:
+        """
+        Read batches from the repository into the stream queue
+
+        Putting into the bounded queue waits while the consumer is behind.
+        The queue is terminated with an end marker, or with the exception
+        that stopped reading.
+
+        Args:
+            queue: Bounded stream queue
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+            options: Stream options
+        """
+        try:
+            offset = 0
+            total_read = 0
+
+            while not self._stop_requested:
+                # Fetch batch
+                candles: CandleBatch
+                if options.as_array:
+                    arrays = await self.repository.get_candle_arrays(
+                        exchange,
+                        symbol,
+                        timeframe,
+                        start_time,
+                        end_time,
+                        limit=options.batch_size,
+                        offset=offset,
+                    )
+                    candles = arrays_to_matrix(arrays)
+                else:
+                    candles = await self.repository.get_candles(
+                        exchange,
+                        symbol,
+                        timeframe,
+                        start_time,
+                        end_time,
+                        limit=options.batch_size,
+                        offset=offset,
+                    )
+
+                if len(candles) == 0:
+                    break
+
+                # Apply max_size limit
+                if options.max_size and total_read + len(candles) > options.max_size:
+                    candles = candles[: options.max_size - total_read]
+
+                await queue.put(candles)
+
+                total_read += len(candles)
+                offset += len(candles)
+
+                # Check if reached max_size
+                if options.max_size and total_read >= options.max_size:
+                    break
+
+            await queue.put(_END_OF_STREAM)
+
+        except Exception as e:
+            await queue.put(e)
+
     async def stream_to_callback(
         self,
         exchange: str,
@@ -154,7 +259,7 @@ class DataStreamer(EventEmitter):
         timeframe: Timeframe,
         start_date: datetime,
         end_date: datetime,
-        callback: Callable[[List[Candle]], None],
+        callback: Callable[[CandleBatch], None],
         options: Optional[StreamOptions] = None,
     ) -> None:
         """
@@ -188,7 +293,7 @@ class DataStreamer(EventEmitter):
         start_date: datetime,
         end_date: datetime,
         options: Optional[StreamOptions] = None,
-    ) -> List[Candle]:
+    ) -> CandleBatch:
         """
         Stream candles to an array
 
@@ -201,19 +306,20 @@ class DataStreamer(EventEmitter):
             options: Stream options
 
         Returns:
-            List of all candles
+            List of all candles, or a single candle matrix if options.as_array
+            is set
         """
         start_time = int(start_date.timestamp() * 1000)
         end_time = int(end_date.timestamp() * 1000)
 
-        all_candles = []
+        batches = []
 
         async for batch in self.stream_candles(
             exchange, symbol, timeframe, start_time, end_time, options
         ):
-            all_candles.extend(batch)
+            batches.append(batch)
 
-        return all_candles
+        return self._concat_batches(batches, options)
 
     async def stream_to_buffer(
         self,
@@ -223,7 +329,7 @@ class DataStreamer(EventEmitter):
         start_date: datetime,
         end_date: datetime,
         buffer_size: int,
-        on_buffer: Callable[[List[Candle]], None],
+        on_buffer: Callable[[CandleBatch], None],
         options: Optional[StreamOptions] = None,
     ) -> None:
         """
@@ -242,12 +348,15 @@ class DataStreamer(EventEmitter):
         start_time = int(start_date.timestamp() * 1000)
         end_time = int(end_date.timestamp() * 1000)
 
-        buffer = []
+        buffer: Any = self._concat_batches([], options)
 
         async for batch in self.stream_candles(
             exchange, symbol, timeframe, start_time, end_time, options
         ):
-            buffer.extend(batch)
+            if isinstance(batch, list):
+                buffer.extend(batch)
+            else:
+                buffer = concat_matrices([buffer, batch])
 
             # Check if buffer is full
             while len(buffer) >= buffer_size:
@@ -262,12 +371,49 @@ class DataStreamer(EventEmitter):
                     on_buffer(full_buffer)
 
         # Process remaining buffer
-        if buffer:
+        if len(buffer) > 0:
             if asyncio.iscoroutinefunction(on_buffer):
                 await on_buffer(buffer)
             else:
                 on_buffer(buffer)
 
+    @staticmethod
+    def _batch_time_span(candles: CandleBatch) -> int:
+        """
+        Get the time between the first and last candle of a batch
+
+        Args:
+            candles: Batch of candles
+
+        Returns:
+            Time span in milliseconds
+        """
+        if isinstance(candles, list):
+            return candles[-1].timestamp - candles[0].timestamp
+        return int(candles[-1, 0] - candles[0, 0])
+
+    @staticmethod
+    def _concat_batches(
+        batches: List[CandleBatch], options: Optional[StreamOptions]
+    ) -> CandleBatch:
+        """
+        Concatenate batches into one batch of the same kind
+
+        Args:
+            batches: Batches to concatenate
+            options: Stream options
+
+        Returns:
+            Combined batch
+        """
+        if options is not None and options.as_array:
+            return concat_matrices([cast("np.ndarray", batch) for batch in batches])
+
+        combined: List[Candle] = []
+        for batch in batches:
+            combined.extend(batch)
+        return combined
+
     def stop(self) -> None:
         """Stop the active stream"""
         self._stop_requested = True
@@ -3,7 +3,9 @@ Event emitter base class for streaming components
 """
 
 import asyncio
-from typing import Any, Callable, Dict, List, Optional
+import functools
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 
 class EventEmitter:
@@ -12,6 +14,10 @@ class EventEmitter:
     def __init__(self) -> None:
         """Initialize event emitter"""
         self._listeners: Dict[str, List[Callable]] = {}
+        # Wrappers registered by once(), mapped to the wrapped handler
+        self._once_handlers: Dict[Callable, Callable] = {}
+        # One future per emit_background() call, oldest first
+        self._pending: Deque[asyncio.Future] = deque()
 
     def on(self, event: str, handler: Callable) -> None:
         """
@@ -48,7 +54,9 @@ class EventEmitter:
         def wrapper(*args: Any, **kwargs: Any) -> None:
             handler(*args, **kwargs)
             self.off(event, wrapper)
+            self._once_handlers.pop(wrapper, None)
 
+        self._once_handlers[wrapper] = handler
         self.on(event, wrapper)
 
     async def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
@@ -67,6 +75,88 @@ class EventEmitter:
                 else:
                     handler(*args, **kwargs)
 
+    def emit_background(self, event: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Emit an event without waiting for handlers to finish
+
+        Coroutine handlers are scheduled as tasks and sync handlers run in the
+        default thread pool executor. Handlers registered with once() are
+        unregistered here, on the event loop, before being dispatched. Use
+        drain_listeners() to wait for them.
+
+        Args:
+            event: Event name
+            *args: Event arguments
+            **kwargs: Event keyword arguments
+        """
+        if event not in self._listeners:
+            return
+
+        loop = asyncio.get_running_loop()
+        futures: List[asyncio.Future] = []
+
+        for handler in list(self._listeners[event]):
+            once_handler = self._once_handlers.pop(handler, None)
+            if once_handler is not None:
+                self.off(event, handler)
+                handler = once_handler
+
+            if asyncio.iscoroutinefunction(handler):
+                futures.append(loop.create_task(handler(*args, **kwargs)))
+            else:
+                futures.append(
+                    loop.run_in_executor(None, functools.partial(handler, *args, **kwargs))
+                )
+
+        if futures:
+            self._pending.append(asyncio.gather(*futures))
+
+    async def drain_listeners(self, limit: int = 0) -> None:
+        """
+        Wait for handlers started by emit_background() to finish
+
+        Emissions are awaited oldest first until at most limit of them are
+        still pending.
+
+        Args:
+            limit: Number of emissions that may remain pending
+
+        Raises:
+            Exception: The first exception raised by a handler
+        """
+        while len(self._pending) > limit:
+            await self._pending.popleft()
+
+    def cancel_listeners(self) -> List[BaseException]:
+        """
+        Cancel handlers started by emit_background() that are still pending
+
+        Handlers already running in the thread pool finish, but their result
+        is discarded.
+
+        Returns:
+            Exceptions raised by handlers that had already failed
+        """
+        errors: List[BaseException] = []
+
+        while self._pending:
+            future = self._pending.popleft()
+            if not future.done():
+                future.cancel()
+                future.add_done_callback(self._discard_result)
+            elif not future.cancelled():
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+
+        return errors
+
+    @staticmethod
+    def _discard_result(future: asyncio.Future) -> None:
+        """Retrieve the outcome of a cancelled emission so it is not reported"""
+        if not future.cancelled():
+            future.exception()
+
     def remove_all_listeners(self, event: Optional[str] = None) -> None:
         """
         Remove all listeners for an event or all events
@@ -75,9 +165,11 @@ class EventEmitter:
             event: Event name (optional)
         """
         if event:
-            self._listeners.pop(event, None)
+            for handler in self._listeners.pop(event, []):
+                self._once_handlers.pop(handler, None)
         else:
             self._listeners.clear()
+            self._once_handlers.clear()
 
     def listener_count(self, event: str) -> int:
         """
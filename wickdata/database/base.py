@@ -4,7 +4,7 @@ Base database interface for WickData
 
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from wickdata.models.candle import Candle
 from wickdata.models.dataset_metadata import DatasetMetadata
@@ -84,6 +84,58 @@ class Database(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_candle_rows(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Tuple[int, float, float, float, float, float]]:
+        """
+        Get raw candle rows from the database
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+            limit: Maximum number of rows to return
+            offset: Number of rows to skip
+
+        Returns:
+            List of (timestamp, open, high, low, close, volume) tuples
+        """
+        pass
+
+    @abstractmethod
+    async def get_candle_timestamps(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+    ) -> List[int]:
+        """
+        Get stored candle timestamps from the database
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+
+        Returns:
+            Sorted list of timestamps (milliseconds)
+        """
+        pass
+
     @abstractmethod
     async def delete_candles(
         self,
@@ -132,6 +184,35 @@ class Database(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_candle_stats(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get aggregate statistics for candles in the database
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+            limit: Maximum number of candles to include
+            offset: Number of candles to skip
+
+        Returns:
+            Dictionary with count, first_timestamp, last_timestamp, min_price,
+            max_price and total_volume
+        """
+        pass
+
     @abstractmethod
     async def get_metadata(
         self,
@@ -2,16 +2,20 @@
 Repository pattern for candle data access
 """
 
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from wickdata.database.base import Database
 from wickdata.models.candle import Candle
 from wickdata.models.data_gap import DataGap
 from wickdata.models.dataset_metadata import DatasetMetadata
 from wickdata.models.timeframe import Timeframe
+from wickdata.utils.candle_arrays import rows_to_arrays
 from wickdata.utils.logger import Logger
 from wickdata.utils.timeframe_utils import TimeframeUtils
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class CandleRepository:
     """Repository for candle data operations"""
@@ -106,6 +110,44 @@ class CandleRepository:
 
         return candles
 
+    async def get_candle_arrays(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, "np.ndarray"]:
+        """
+        Get candles from the database as parallel NumPy arrays
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+            limit: Maximum number of candles to return
+            offset: Number of candles to skip
+
+        Returns:
+            Dictionary of timestamp, open, high, low, close and volume arrays
+        """
+        rows = await self.database.get_candle_rows(
+            exchange, symbol, str(timeframe), start_time, end_time, limit, offset
+        )
+
+        self.logger.debug(
+            f"Retrieved {len(rows)} candles",
+            exchange=exchange,
+            symbol=symbol,
+            timeframe=str(timeframe),
+        )
+
+        return rows_to_arrays(rows)
+
     async def delete_candles(
         self,
         exchange: str,
@@ -169,6 +211,36 @@ class CandleRepository:
             exchange, symbol, str(timeframe), start_time, end_time
         )
 
+    async def get_candle_stats(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: Timeframe,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get aggregate statistics for candles in the database
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+            limit: Maximum number of candles to include
+            offset: Number of candles to skip
+
+        Returns:
+            Dictionary with count, first_timestamp, last_timestamp, min_price,
+            max_price and total_volume
+        """
+        return await self.database.get_candle_stats(
+            exchange, symbol, str(timeframe), start_time, end_time, limit, offset
+        )
+
     async def find_data_gaps(
         self,
         exchange: str,
@@ -190,10 +262,12 @@ class CandleRepository:
         Returns:
             List of data gaps
         """
-        # Get all candles in the range
-        candles = await self.get_candles(exchange, symbol, timeframe, start_time, end_time)
+        # Only timestamps are needed, so avoid loading full candles
+        timestamps = await self.database.get_candle_timestamps(
+            exchange, symbol, str(timeframe), start_time, end_time
+        )
 
-        if not candles:
+        if not timestamps:
             # Entire range is a gap
             candle_count = TimeframeUtils.get_candle_count(start_time, end_time, timeframe)
             return [DataGap(start_time, end_time, candle_count)]
@@ -202,17 +276,17 @@ class CandleRepository:
         timeframe_ms = timeframe.to_milliseconds()
 
         # Check gap at the beginning
-        if candles[0].timestamp > start_time:
+        if timestamps[0] > start_time:
             gap_start = start_time
-            gap_end = candles[0].timestamp - timeframe_ms
+            gap_end = timestamps[0] - timeframe_ms
             if gap_end >= gap_start:
                 candle_count = TimeframeUtils.get_candle_count(gap_start, gap_end, timeframe)
                 gaps.append(DataGap(gap_start, gap_end, candle_count))
 
         # Check gaps between candles
-        for i in range(len(candles) - 1):
-            expected_next = candles[i].timestamp + timeframe_ms
-            actual_next = candles[i + 1].timestamp
+        for i in range(len(timestamps) - 1):
+            expected_next = timestamps[i] + timeframe_ms
+            actual_next = timestamps[i + 1]
 
             if actual_next > expected_next:
                 gap_start = expected_next
@@ -221,7 +295,7 @@ class CandleRepository:
                 gaps.append(DataGap(gap_start, gap_end, candle_count))
 
         # Check gap at the end
-        last_expected = candles[-1].timestamp + timeframe_ms
+        last_expected = timestamps[-1] + timeframe_ms
         if last_expected <= end_time:
             gap_start = last_expected
             gap_end = end_time
@@ -35,7 +35,7 @@ class DatabaseFactory:
                     "Database URL is required",
                     config_key="database.url",
                 )
-            return SQLiteDatabase(config.url, logger)
+            return SQLiteDatabase(config.url, logger, config.pool_config)
         else:
             raise ConfigurationError(
                 f"Unsupported database provider: {config.provider}",
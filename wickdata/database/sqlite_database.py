@@ -4,16 +4,19 @@ SQLite database implementation for WickData
 
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncGenerator, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import and_, delete, event, func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from wickdata.core.errors import DatabaseError
 from wickdata.database.base import Database
 from wickdata.database.models import Base, CandleModel, DatasetMetadataModel
 from wickdata.models.candle import Candle
+from wickdata.models.config import PoolConfig
 from wickdata.models.dataset_metadata import DatasetMetadata
 from wickdata.utils.logger import Logger
 
@@ -21,16 +24,23 @@ from wickdata.utils.logger import Logger
 class SQLiteDatabase(Database):
     """SQLite database implementation"""
 
-    def __init__(self, url: str, logger: Optional[Logger] = None) -> None:
+    def __init__(
+        self,
+        url: str,
+        logger: Optional[Logger] = None,
+        pool_config: Optional[PoolConfig] = None,
+    ) -> None:
         """
         Initialize SQLite database
 
         Args:
             url: Database URL (e.g., sqlite:///wickdata.db)
             logger: Logger instance
+            pool_config: Connection pool configuration
         """
         self.url = url
         self.logger = logger or Logger("SQLiteDatabase")
+        self.pool_config = pool_config or PoolConfig()
         self.engine: Optional[AsyncEngine] = None
         self.async_session: Optional[sessionmaker] = None
 
@@ -45,10 +55,14 @@ class SQLiteDatabase(Database):
 
             self.engine = create_async_engine(
                 async_url,
-                echo=False,
+                echo=self.pool_config.enable_query_logging,
                 future=True,
+                **self._pool_options(),
             )
 
+            if not self._is_memory_database():
+                event.listen(self.engine.sync_engine, "connect", self._configure_connection)
+
             self.async_session = sessionmaker(
                 self.engine,
                 class_=AsyncSession,
@@ -59,6 +73,44 @@ class SQLiteDatabase(Database):
         except Exception as e:
             raise DatabaseError(f"Failed to connect to database: {e}", operation="connect")
 
+    @staticmethod
+    def _configure_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+        """
+        Apply pragmas to each new pooled connection
+
+        WAL lets readers run alongside a writer, and synchronous=NORMAL avoids
+        an fsync on every commit while remaining safe in WAL mode.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+    def _is_memory_database(self) -> bool:
+        """Check whether the URL points to an in-memory database"""
+        return ":memory:" in self.url or self.url.rstrip("/").endswith(":")
+
+    def _pool_options(self) -> Dict[str, Any]:
+        """
+        Build engine pool options from the pool configuration
+
+        Connections are opened lazily and kept open between queries so SQLite's
+        page cache stays warm across the many small reads issued by queries and
+        streams. In-memory databases keep SQLAlchemy's default shared connection.
+
+        Returns:
+            Keyword arguments for create_async_engine
+        """
+        if self._is_memory_database():
+            return {}
+
+        return {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": max(1, self.pool_config.max_connections),
+            "max_overflow": 0,
+            "pool_timeout": self.pool_config.timeout,
+        }
+
     async def disconnect(self) -> None:
         """Disconnect from the database"""
         if self.engine:
@@ -98,39 +150,29 @@ class SQLiteDatabase(Database):
             if not isinstance(candle, Candle):
                 raise TypeError(f"Expected Candle object, got {type(candle)}")
 
-        inserted_count = 0
+        rows = [
+            {
+                "exchange": exchange,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "timestamp": candle.timestamp,
+                "open": candle.open,
+                "high": candle.high,
+                "low": candle.low,
+                "close": candle.close,
+                "volume": candle.volume,
+            }
+            for candle in candles
+        ]
 
         try:
             async with self.transaction() as session:
-                for candle in candles:
-                    # Check if candle already exists
-                    stmt = select(CandleModel).where(
-                        and_(
-                            CandleModel.exchange == exchange,
-                            CandleModel.symbol == symbol,
-                            CandleModel.timeframe == timeframe,
-                            CandleModel.timestamp == candle.timestamp,
-                        )
-                    )
-                    result = await session.execute(stmt)
-                    existing = result.scalar_one_or_none()
-
-                    if not existing:
-                        candle_model = CandleModel(
-                            exchange=exchange,
-                            symbol=symbol,
-                            timeframe=timeframe,
-                            timestamp=candle.timestamp,
-                            open=candle.open,
-                            high=candle.high,
-                            low=candle.low,
-                            close=candle.close,
-                            volume=candle.volume,
-                        )
-                        session.add(candle_model)
-                        inserted_count += 1
-
-                await session.commit()
+                # Single executemany; existing candles are skipped by the unique constraint
+                stmt = sqlite_insert(CandleModel.__table__).on_conflict_do_nothing(
+                    index_elements=["exchange", "symbol", "timeframe", "timestamp"]
+                )
+                result = await session.execute(stmt, rows)
+                inserted_count = result.rowcount
 
             self.logger.debug(
                 f"Inserted {inserted_count} candles",
@@ -139,7 +181,7 @@ class SQLiteDatabase(Database):
                 timeframe=timeframe,
             )
 
-            return inserted_count
+            return inserted_count  # type: ignore[no-any-return]
 
         except Exception as e:
             raise DatabaseError(
@@ -159,10 +201,33 @@ class SQLiteDatabase(Database):
         offset: Optional[int] = None,
     ) -> List[Candle]:
         """Get candles from the database"""
+        rows = await self.get_candle_rows(
+            exchange, symbol, timeframe, start_time, end_time, limit, offset
+        )
+        return [Candle(*row) for row in rows]
+
+    async def get_candle_rows(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[Tuple[int, float, float, float, float, float]]:
+        """Get raw candle rows from the database"""
         try:
             async with self.async_session() as session:  # type: ignore[misc]
                 stmt = (
-                    select(CandleModel)
+                    select(
+                        CandleModel.timestamp,
+                        CandleModel.open,
+                        CandleModel.high,
+                        CandleModel.low,
+                        CandleModel.close,
+                        CandleModel.volume,
+                    )
                     .where(
                         and_(
                             CandleModel.exchange == exchange,
@@ -181,21 +246,8 @@ class SQLiteDatabase(Database):
                     stmt = stmt.limit(limit)
 
                 result = await session.execute(stmt)
-                candle_models = result.scalars().all()
-
-                candles = [
-                    Candle(
-                        timestamp=model.timestamp,
-                        open=model.open,
-                        high=model.high,
-                        low=model.low,
-                        close=model.close,
-                        volume=model.volume,
-                    )
-                    for model in candle_models
-                ]
 
-                return candles
+                return [tuple(row) for row in result.all()]
 
         except Exception as e:
             raise DatabaseError(
@@ -204,6 +256,42 @@ class SQLiteDatabase(Database):
                 table="candles",
             )
 
+    async def get_candle_timestamps(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+    ) -> List[int]:
+        """Get stored candle timestamps from the database"""
+        try:
+            async with self.async_session() as session:  # type: ignore[misc]
+                stmt = (
+                    select(CandleModel.timestamp)
+                    .where(
+                        and_(
+                            CandleModel.exchange == exchange,
+                            CandleModel.symbol == symbol,
+                            CandleModel.timeframe == timeframe,
+                            CandleModel.timestamp >= start_time,
+                            CandleModel.timestamp <= end_time,
+                        )
+                    )
+                    .order_by(CandleModel.timestamp)
+                )
+
+                result = await session.execute(stmt)
+
+                return list(result.scalars().all())
+
+        except Exception as e:
+            raise DatabaseError(
+                f"Failed to get candle timestamps: {e}",
+                operation="select",
+                table="candles",
+            )
+
     async def delete_candles(
         self,
         exchange: str,
@@ -283,6 +371,79 @@ class SQLiteDatabase(Database):
                 table="candles",
             )
 
+    async def get_candle_stats(
+        self,
+        exchange: str,
+        symbol: str,
+        timeframe: str,
+        start_time: int,
+        end_time: int,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Get aggregate statistics for candles in the database"""
+        try:
+            async with self.async_session() as session:  # type: ignore[misc]
+                conditions = and_(
+                    CandleModel.exchange == exchange,
+                    CandleModel.symbol == symbol,
+                    CandleModel.timeframe == timeframe,
+                    CandleModel.timestamp >= start_time,
+                    CandleModel.timestamp <= end_time,
+                )
+
+                if limit or offset:
+                    # Aggregate over the same page of candles a query would return
+                    page = (
+                        select(
+                            CandleModel.timestamp,
+                            CandleModel.high,
+                            CandleModel.low,
+                            CandleModel.volume,
+                        )
+                        .where(conditions)
+                        .order_by(CandleModel.timestamp)
+                    )
+                    if offset:
+                        page = page.offset(offset)
+                    if limit:
+                        page = page.limit(limit)
+                    source: Any = page.subquery()
+                    where = None
+                else:
+                    source = CandleModel.__table__
+                    where = conditions
+
+                stmt = select(
+                    func.count(),
+                    func.min(source.c.timestamp),
+                    func.max(source.c.timestamp),
+                    func.min(source.c.low),
+                    func.max(source.c.high),
+                    func.sum(source.c.volume),
+                )
+                if where is not None:
+                    stmt = stmt.where(where)
+
+                result = await session.execute(stmt)
+                count, first_ts, last_ts, min_price, max_price, total_volume = result.one()
+
+                return {
+                    "count": count,
+                    "first_timestamp": first_ts,
+                    "last_timestamp": last_ts,
+                    "min_price": min_price,
+                    "max_price": max_price,
+                    "total_volume": total_volume or 0,
+                }
+
+        except Exception as e:
+            raise DatabaseError(
+                f"Failed to get candle stats: {e}",
+                operation="select",
+                table="candles",
+            )
+
     async def get_metadata(
         self,
         exchange: str,
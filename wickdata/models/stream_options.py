@@ -11,10 +11,13 @@ class StreamOptions:
     """Options for streaming candle data"""
 
     batch_size: int = 1000
-    delay_ms: int = 0  # Delay between batches in milliseconds
+    delay_ms: int = 0  # Optional fixed delay between batches in milliseconds
     realtime: bool = False  # Replay at real-time speed
     max_size: Optional[int] = None  # Maximum number of candles to stream
     buffer_size: Optional[int] = None  # Buffer size for streaming
+    max_outstanding_batches: int = 2  # Batches read ahead before waiting on the consumer
+    background_events: bool = False  # Run batch event handlers off the stream loop
+    as_array: bool = False  # Yield row-major NumPy batches instead of Candle lists
 
     def __post_init__(self) -> None:
         """Validate stream options"""
@@ -24,6 +27,9 @@ class StreamOptions:
         if self.delay_ms < 0:
             raise ValueError("delay_ms cannot be negative")
 
+        if self.max_outstanding_batches <= 0:
+            raise ValueError("max_outstanding_batches must be positive")
+
         if self.max_size is not None and self.max_size <= 0:
             raise ValueError("max_size must be positive")
 
@@ -5,6 +5,7 @@ Service layer components for WickData
 from wickdata.services.data_fetcher_service import DataFetcherService
 from wickdata.services.data_validation_service import DataValidationService
 from wickdata.services.gap_analysis_service import GapAnalysisService
+from wickdata.services.negative_range_cache import NegativeRangeCache
 from wickdata.services.retry_service import RetryService
 
 __all__ = [
@@ -12,4 +13,5 @@ __all__ = [
     "RetryService",
     "DataValidationService",
     "DataFetcherService",
+    "NegativeRangeCache",
 ]
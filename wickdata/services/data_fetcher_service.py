@@ -41,6 +41,8 @@ class DataFetcherService:
         self.retry_service = retry_service or RetryService()
         self.validation_service = validation_service or DataValidationService()
         self.logger = logger or Logger("DataFetcherService")
+        # Gaps for which at least one batch failed to fetch
+        self.failed_gaps: List[DataGap] = []
 
     async def fetch_gap(
         self,
@@ -61,11 +63,13 @@ class DataFetcherService:
             progress_callback: Progress callback
 
         Returns:
-            List of fetched candles
+            List of fetched candles. Gaps that could not be fully fetched are
+            recorded in failed_gaps.
         """
         all_candles = []
         current_start = gap.start_time
         timeframe_ms = timeframe.to_milliseconds()
+        failed = False
 
         while current_start <= gap.end_time:
             # Calculate batch end time
@@ -119,9 +123,13 @@ class DataFetcherService:
                     start=current_start,
                     end=batch_end,
                 )
+                failed = True
                 # Move to next batch even on error
                 current_start = batch_end + timeframe_ms
 
+        if failed:
+            self.failed_gaps.append(gap)
+
         self.logger.info(
             f"Fetched {len(all_candles)} candles for gap",
             symbol=symbol,
@@ -153,7 +161,8 @@ class DataFetcherService:
             progress_callback: Progress callback
 
         Returns:
-            List of fetched candles
+            List of fetched candles. Gaps that failed are recorded in
+            failed_gaps.
         """
         if not gaps:
             return []
@@ -192,11 +201,12 @@ class DataFetcherService:
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Collect successful results
-        for result in results:
+        for gap, result in zip(gaps, results):
             if isinstance(result, list):
                 all_candles.extend(result)
             elif isinstance(result, Exception):
                 self.logger.error(f"Gap fetch failed: {result}")
+                self.failed_gaps.append(gap)
 
         # Sort and deduplicate
         all_candles = self.validation_service.sanitize_candles(all_candles)
@@ -0,0 +1,80 @@
+"""
+Cache of time ranges known to have no data on an exchange
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+CacheKey = Tuple[str, str, str]
+
+
+class NegativeRangeCache:
+    """Short-lived cache of ranges for which an exchange returned no candles"""
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Initialize negative range cache
+
+        Args:
+            ttl: Time to live for cached ranges in seconds
+            clock: Monotonic clock function (defaults to time.monotonic)
+        """
+        self.ttl = ttl
+        self._clock = clock or time.monotonic
+        self._ranges: Dict[CacheKey, List[Tuple[int, int, float]]] = {}
+
+    def add(
+        self, exchange: str, symbol: str, timeframe: str, start_time: int, end_time: int
+    ) -> None:
+        """
+        Record a range that returned no candles
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+        """
+        key = (exchange, symbol, timeframe)
+        expires_at = self._clock() + self.ttl
+        self._ranges[key] = self._fresh_ranges(key) + [(start_time, end_time, expires_at)]
+
+    def contains(
+        self, exchange: str, symbol: str, timeframe: str, start_time: int, end_time: int
+    ) -> bool:
+        """
+        Check whether a range is covered by a fresh empty range
+
+        Args:
+            exchange: Exchange name
+            symbol: Trading pair symbol
+            timeframe: Timeframe
+            start_time: Start timestamp (milliseconds)
+            end_time: End timestamp (milliseconds)
+
+        Returns:
+            True if the whole range is known to be empty
+        """
+        ranges = self._fresh_ranges((exchange, symbol, timeframe))
+        return any(start <= start_time and end_time <= end for start, end, _ in ranges)
+
+    def clear(self) -> None:
+        """Remove all cached ranges"""
+        self._ranges.clear()
+
+    def _fresh_ranges(self, key: CacheKey) -> List[Tuple[int, int, float]]:
+        """Drop expired ranges for a key and return the remaining ones"""
+        now = self._clock()
+        ranges = [entry for entry in self._ranges.get(key, []) if entry[2] > now]
+
+        if ranges:
+            self._ranges[key] = ranges
+        else:
+            self._ranges.pop(key, None)
+
+        return ranges
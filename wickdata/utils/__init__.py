@@ -2,6 +2,12 @@
 Utility functions and classes for WickData
 """
 
+from wickdata.utils.candle_arrays import (
+    arrays_to_matrix,
+    candles_to_arrays,
+    concat_matrices,
+    rows_to_arrays,
+)
 from wickdata.utils.config_helpers import (
     create_binance_config,
     create_bybit_config,
@@ -22,6 +28,10 @@ from wickdata.utils.validation import (
 
 __all__ = [
     "TimeframeUtils",
+    "candles_to_arrays",
+    "arrays_to_matrix",
+    "concat_matrices",
+    "rows_to_arrays",
     "validate_symbol",
     "validate_exchange_name",
     "validate_timeframe",
@@ -0,0 +1,111 @@
+"""
+Columnar (NumPy) candle representation for WickData
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+from wickdata.models.candle import Candle
+
+if TYPE_CHECKING:
+    import numpy as np
+
+CandleRow = Tuple[int, float, float, float, float, float]
+
+# Column name and NumPy dtype, in candle row order
+CANDLE_COLUMNS: List[Tuple[str, str]] = [
+    ("timestamp", "int64"),
+    ("open", "float64"),
+    ("high", "float64"),
+    ("low", "float64"),
+    ("close", "float64"),
+    ("volume", "float64"),
+]
+
+
+def _import_numpy() -> Any:
+    """Import NumPy, raising a helpful error if it is not installed"""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for array output. Install it with: pip install wickdata[numpy]"
+        ) from e
+    return numpy
+
+
+def rows_to_arrays(rows: Sequence[Sequence[Any]]) -> Dict[str, "np.ndarray"]:
+    """
+    Convert candle rows to parallel NumPy arrays
+
+    Args:
+        rows: Rows of (timestamp, open, high, low, close, volume)
+
+    Returns:
+        Dictionary mapping column name to array, timestamps as int64 and
+        OHLCV values as float64
+    """
+    numpy = _import_numpy()
+    count = len(rows)
+
+    return {
+        name: numpy.fromiter((row[index] for row in rows), dtype=dtype, count=count)
+        for index, (name, dtype) in enumerate(CANDLE_COLUMNS)
+    }
+
+
+def candles_to_arrays(candles: Sequence[Candle]) -> Dict[str, "np.ndarray"]:
+    """
+    Convert candles to parallel NumPy arrays
+
+    Args:
+        candles: List of candles
+
+    Returns:
+        Dictionary mapping column name to array
+    """
+    return rows_to_arrays([candle.to_ccxt() for candle in candles])
+
+
+def arrays_to_matrix(arrays: Dict[str, "np.ndarray"]) -> "np.ndarray":
+    """
+    Pack column arrays into a row-major candle matrix
+
+    Each row holds one candle as (timestamp, open, high, low, close, volume)
+    in float64, so consumers walking the batch row by row read memory
+    sequentially. Use ``matrix.T`` for a zero-copy column-oriented view.
+
+    Args:
+        arrays: Dictionary of column arrays as returned by rows_to_arrays
+
+    Returns:
+        C-contiguous float64 array of shape (n, 6)
+    """
+    numpy = _import_numpy()
+    count = len(arrays[CANDLE_COLUMNS[0][0]])
+
+    matrix: "np.ndarray" = numpy.empty((count, len(CANDLE_COLUMNS)), dtype=numpy.float64, order="C")
+    for index, (name, _dtype) in enumerate(CANDLE_COLUMNS):
+        matrix[:, index] = arrays[name]
+
+    return matrix
+
+
+def concat_matrices(matrices: Sequence["np.ndarray"]) -> "np.ndarray":
+    """
+    Concatenate candle matrices into a single row-major matrix
+
+    Args:
+        matrices: Candle matrices as returned by arrays_to_matrix
+
+    Returns:
+        C-contiguous float64 array of shape (n, 6)
+    """
+    numpy = _import_numpy()
+
+    combined: "np.ndarray"
+    if matrices:
+        combined = numpy.ascontiguousarray(numpy.concatenate(matrices))
+    else:
+        combined = numpy.empty((0, len(CANDLE_COLUMNS)), dtype=numpy.float64)
+
+    return combined